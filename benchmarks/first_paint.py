@@ -0,0 +1,120 @@
+"""First-contentful-paint measurement for the Stoki dashboard.
+
+Starts the dashboard with `streamlit run`, loads it in headless Chromium and
+reports the browser's first-contentful-paint plus the time until the page
+header is on screen. By default every request that does not go to the local
+server is aborted, which mimics an air-gapped deployment.
+
+Requires Playwright (`pip install playwright && playwright install chromium`).
+
+    python benchmarks/first_paint.py --runs 5
+    python benchmarks/first_paint.py --runs 5 --allow-network
+"""
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlparse
+
+APP = Path(__file__).resolve().parent.parent / "stoki_dashboard.py"
+LOCAL_HOSTS = {"localhost", "127.0.0.1"}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, timeout=60):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP),
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.25)
+    server.terminate()
+    raise RuntimeError("Streamlit server did not become healthy")
+
+
+def measure(browser, url, allow_network, timeout_ms):
+    context = browser.new_context()
+    blocked = []
+
+    def route(request_route):
+        host = urlparse(request_route.request.url).hostname
+        if allow_network or host in LOCAL_HOSTS:
+            request_route.continue_()
+        else:
+            blocked.append(request_route.request.url)
+            request_route.abort("internetdisconnected")
+
+    context.route("**/*", route)
+    page = context.new_page()
+    page.goto(url)
+    page.wait_for_selector(".main-header", timeout=timeout_ms)
+    header_ms = page.evaluate("performance.now()")
+    fcp_ms = page.evaluate(
+        "(performance.getEntriesByName('first-contentful-paint')[0] || {}).startTime || null"
+    )
+    context.close()
+    return fcp_ms, header_ms, blocked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--allow-network", action="store_true",
+                        help="let requests to non-local hosts through")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="seconds to wait for the header to render")
+    args = parser.parse_args()
+
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        sys.exit("Playwright is required: pip install playwright && playwright install chromium")
+
+    port = free_port()
+    server = start_server(port)
+    url = f"http://127.0.0.1:{port}/"
+    fcps, headers, blocked = [], [], set()
+    try:
+        with sync_playwright() as pw:
+            browser = pw.chromium.launch()
+            for _ in range(args.runs):
+                fcp_ms, header_ms, run_blocked = measure(
+                    browser, url, args.allow_network, args.timeout * 1000)
+                if fcp_ms is not None:
+                    fcps.append(fcp_ms)
+                headers.append(header_ms)
+                blocked.update(run_blocked)
+            browser.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+    mode = "network allowed" if args.allow_network else "network disabled"
+    print(f"First paint ({mode}, {args.runs} runs)")
+    if fcps:
+        print(f"  first-contentful-paint: median {statistics.median(fcps):8.1f} ms  max {max(fcps):8.1f} ms")
+    print(f"  header visible:         median {statistics.median(headers):8.1f} ms  max {max(headers):8.1f} ms")
+    print(f"  blocked remote requests: {len(blocked)}")
+    for blocked_url in sorted(blocked):
+        print(f"    {blocked_url}")
+
+
+if __name__ == "__main__":
+    main()
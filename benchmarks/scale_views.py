@@ -0,0 +1,177 @@
+"""Scale benchmark for every dashboard view's data-prep and figure-build path.
+
+Generates seeded synthetic data at each scale (see
+stoki_data.generate_scaled_data), then times each view's figure builders and
+data prep and records peak traced memory. For every case the report shows
+the growth exponent against the previous scale: ~1 is linear, anything well
+above 1 is a super-linear blow-up worth looking at.
+
+Cases whose projected time at the next scale exceeds --budget seconds are
+skipped there, so a quadratic path cannot hold the whole run hostage.
+
+    python benchmarks/scale_views.py
+    python benchmarks/scale_views.py --scales 1 10 100 --views "Market Overview"
+"""
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stoki_analytics import (pack_features, coverage_summary, dominated_competitors,  # noqa: E402
+                             minimal_winning_set, greedy_roadmap)
+from stoki_aggregation import count_pain_points, iter_batches, pain_point_summary  # noqa: E402
+from stoki_data import DATA_FIELDS, generate_scaled_data, generate_survey_responses  # noqa: E402
+from stoki_figures import (VIEW_FIGURES, build_view_figures, build_progress_rows,  # noqa: E402
+                           build_roadmap_rows)
+
+SUPER_LINEAR = 1.2
+# Free-text survey responses per unit of scale (10,000x -> 200k responses)
+SURVEY_RESPONSES_PER_SCALE = 20
+# Below this the exponent is mostly timer noise
+MIN_SIGNIFICANT_S = 0.05
+
+
+def prep_market_overview(data):
+    counts = count_pain_points(iter_batches(data['survey_responses']))
+    pain_point_summary(counts, data['pain_points'])
+
+
+def prep_competitive_landscape(data):
+    packed = pack_features(data['features'])
+    coverage_summary(packed, target='Stoki')
+    dominated_competitors(packed, target='Stoki')
+    minimal_winning_set(packed, target='Stoki', share=0.8)
+    greedy_roadmap(packed, target='Stoki')
+
+
+def prep_performance_tracker(data):
+    return build_progress_rows(data['results'])
+
+
+def prep_go_to_market(data):
+    # Fixed four-phase table, so this curve is flat by construction
+    return build_roadmap_rows()
+
+
+# Data prep the dashboard does outside the figure builders. The per-row
+# st.* calls that render these rows need a Streamlit session and are not timed.
+VIEW_PREP = {
+    "Market Overview": prep_market_overview,
+    "Competitive Landscape": prep_competitive_landscape,
+    "Performance Tracker": prep_performance_tracker,
+    "Go-to-Market Plan": prep_go_to_market,
+}
+
+
+def measure(func, repeat, trace_memory):
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+
+def growth_exponent(prev, scale, seconds):
+    if prev is None or prev['seconds'] is None:
+        return None
+    if max(prev['seconds'], seconds) < MIN_SIGNIFICANT_S:
+        return None
+    return math.log(seconds / prev['seconds']) / math.log(scale / prev['scale'])
+
+
+def projected_seconds(prev, scale):
+    exponent = max(1.0, prev['exponent'] or 1.0)
+    return prev['seconds'] * (scale / prev['scale']) ** exponent
+
+
+def run(scales, views, seed, repeat, budget, trace_memory):
+    cases = [("generate", None)]
+    for view in views:
+        if view in VIEW_PREP:
+            cases.append((f"{view} / prep", (VIEW_PREP[view], view)))
+        cases.append((f"{view} / figures", (None, view)))
+
+    rows = []
+    last = {}
+    for scale in scales:
+        data = None
+        for name, spec in cases:
+            prev = last.get(name)
+            if prev is not None and prev['seconds'] is None:
+                row = dict(case=name, scale=scale, seconds=None, peak_bytes=None, exponent=None, note=prev['note'])
+                rows.append(row)
+                print(format_row(row), flush=True)
+                continue
+            if prev is not None and projected_seconds(prev, scale) > budget:
+                note = f"skipped: projected {projected_seconds(prev, scale):.0f}s > budget"
+                row = dict(case=name, scale=scale, seconds=None, peak_bytes=None, exponent=None, note=note)
+                rows.append(row)
+                last[name] = row
+                print(format_row(row), flush=True)
+                continue
+
+            if spec is None:
+                func = lambda: generate_scaled_data(scale, seed)
+            else:
+                prep, view = spec
+                if data is None:
+                    data = dict(zip(DATA_FIELDS, generate_scaled_data(scale, seed)))
+                    data['survey_responses'] = generate_survey_responses(SURVEY_RESPONSES_PER_SCALE * scale, seed)
+                func = (lambda p=prep: p(data)) if prep else (lambda v=view: build_view_figures(v, data))
+
+            seconds, peak = measure(func, repeat, trace_memory)
+            exponent = growth_exponent(prev, scale, seconds)
+            note = "SUPER-LINEAR" if exponent is not None and exponent > SUPER_LINEAR else ""
+            row = dict(case=name, scale=scale, seconds=seconds, peak_bytes=peak, exponent=exponent, note=note)
+            rows.append(row)
+            last[name] = row
+            print(format_row(row), flush=True)
+    return rows
+
+
+def format_row(row):
+    seconds = f"{row['seconds'] * 1000:10.1f}" if row['seconds'] is not None else f"{'-':>10}"
+    peak = f"{row['peak_bytes'] / 2**20:9.1f}" if row['peak_bytes'] is not None else f"{'-':>9}"
+    exponent = f"{row['exponent']:5.2f}" if row['exponent'] is not None else f"{'-':>5}"
+    return f"{row['case']:<40} {row['scale']:>7}x {seconds} ms {peak} MiB  k={exponent}  {row['note']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 100, 10000])
+    parser.add_argument("--views", nargs="+", default=list(VIEW_FIGURES), choices=list(VIEW_FIGURES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per case (best is kept)")
+    parser.add_argument("--budget", type=float, default=60.0,
+                        help="skip a case once its projected time exceeds this many seconds")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    args = parser.parse_args()
+
+    print(f"{'case':<40} {'scale':>8} {'time':>13} {'peak':>13}  k = growth exponent vs previous scale")
+    rows = run(sorted(set(args.scales)), args.views, args.seed, args.repeat, args.budget,
+               not args.no_memory)
+
+    flagged = [row for row in rows if row['note']]
+    if flagged:
+        print("\nNeeds attention:")
+        for row in flagged:
+            print(f"  {row['case']} @ {row['scale']}x: {row['note']}")
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
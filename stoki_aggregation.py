@@ -0,0 +1,134 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Server-side aggregation for charts whose input can grow without bound.
+#
+# Survey responses are classified and counted batch by batch into a fixed-size
+# count vector, and chart frames are capped to top-K rows plus an "Other"
+# bucket, so figure build time depends on K rather than on the input size.
+
+OTHER_LABEL = 'Other'
+
+# Pain-point category -> case-insensitive pattern, first match wins
+PAIN_POINT_PATTERNS = {
+    # "not paid" / "haven't paid" only count when no supplier is mentioned
+    'Late payments from clients': (r"late pay|pay(?:s|ing)? late|paid late|overdue|unpaid|owe[sd]? us"
+                                   r"|chas\w* (?:clients|invoices|payments)"
+                                   r"|^(?!.*(?:supplier|vendor|creditor)).*\b(?:not|ha(?:ve|s)n['’]?t) (?:been )?paid"),
+    'Time spent on admin/invoicing/VAT': r'admin|paperwork|invoic|\bvat\b|sars|bookkeep|reconcil',
+    'Understanding cash flow': r'cash ?flow|forecast|runway|money (?:is )?(?:coming|going)',
+    'Paying suppliers': r'supplier|vendor|creditor|stock orders',
+}
+
+# Largest frames the charts are built from
+PAIN_POINT_TOP_K = 8
+CHANNEL_MAX_POINTS = 60
+CHANNEL_LABEL_LIMIT = 12
+
+
+def classify_responses(responses, patterns=PAIN_POINT_PATTERNS):
+    """Category code per response: index into `patterns`, len(patterns) if unmatched."""
+    texts = pd.Series(responses, dtype=object).fillna('').to_numpy()
+    codes = np.full(len(texts), len(patterns))
+    # Each pattern only scans the responses no earlier pattern matched
+    pending = np.arange(len(texts))
+    for code, pattern in enumerate(patterns.values()):
+        if not len(pending):
+            break
+        hit = pd.Series(texts[pending]).str.contains(pattern, flags=re.IGNORECASE, regex=True).to_numpy()
+        codes[pending[hit]] = code
+        pending = pending[~hit]
+    return codes
+
+
+def count_pain_points(batches, patterns=PAIN_POINT_PATTERNS):
+    """Stream batches of free-text responses into per-category counts.
+
+    Only one batch is held at a time; the running state is a count vector of
+    len(patterns) + 1 (the last slot counts unmatched responses).
+    """
+    counts = np.zeros(len(patterns) + 1, dtype=np.int64)
+    for batch in batches:
+        counts += np.bincount(classify_responses(batch, patterns), minlength=len(counts))
+    return pd.Series(counts, index=list(patterns) + [OTHER_LABEL], name='Responses')
+
+
+def iter_batches(responses, batch_size=10000):
+    for start in range(0, len(responses), batch_size):
+        yield responses[start:start + batch_size]
+
+
+def top_k_with_other(frame, value_col, label_col, k, other_values=None):
+    """Keep the k largest rows by `value_col` and sum the rest into an "Other" row.
+
+    Frames with at most k + 1 rows are returned unchanged (including row
+    order). Other columns of the "Other" row take the values of the largest
+    dropped row unless given in `other_values`.
+    """
+    if len(frame) <= k + 1:
+        return frame
+    ranked = frame.sort_values(value_col, ascending=False, kind='stable')
+    top, rest = ranked.iloc[:k], ranked.iloc[k:]
+    other = rest.iloc[[0]].copy()
+    other[label_col] = OTHER_LABEL
+    other[value_col] = rest[value_col].sum()
+    for col, value in (other_values or {}).items():
+        other[col] = value
+    return pd.concat([top, other], ignore_index=True)
+
+
+def pain_point_summary(counts, pain_points, top_k=PAIN_POINT_TOP_K):
+    """Turn streamed counts into a pain_points frame (see stoki_data) for charting.
+
+    The top_k categories are kept, everything else (including unmatched
+    responses) goes to a trailing "Other" row. Prevalence is the share of all
+    responses; Addressed_by_Stoki and Priority come from `pain_points`, and
+    categories it does not list count as unaddressed with the lowest priority.
+    """
+    matched = counts.drop(OTHER_LABEL).sort_values(ascending=False, kind='stable')
+    kept = matched.iloc[:top_k]
+    other = matched.iloc[top_k:].sum() + counts[OTHER_LABEL]
+    if other:
+        kept = pd.concat([kept, pd.Series({OTHER_LABEL: other})])
+
+    total = counts.sum()
+    summary = pd.DataFrame({
+        'Pain_Point': kept.index,
+        'Prevalence': np.round(kept.to_numpy() / total * 100, 1) if total else 0.0,
+        'Responses': kept.to_numpy(),
+    })
+    meta = pain_points.set_index('Pain_Point')[['Addressed_by_Stoki', 'Priority']]
+    summary = summary.join(meta, on='Pain_Point')
+    summary['Addressed_by_Stoki'] = summary['Addressed_by_Stoki'].fillna(False).astype(bool)
+    summary['Priority'] = summary['Priority'].fillna(meta['Priority'].max()).astype(int)
+    return summary
+
+
+def aggregate_channels(channels, max_points=CHANNEL_MAX_POINTS):
+    """Collapse channels into at most ~max_points bubbles.
+
+    Small frames are returned unchanged. Larger ones are grouped by Volume,
+    Priority and a CAC bin; each bubble sits at the mean CAC, is sized by the
+    summed Investment_Focus and is labelled with its largest channel.
+    """
+    if len(channels) <= max_points:
+        return channels
+    groups = channels.groupby(['Volume', 'Priority']).ngroups
+    n_bins = max(1, max_points // max(groups, 1))
+    cac_bin = pd.cut(channels['CAC'], bins=n_bins, labels=False, include_lowest=True)
+    biggest = channels.sort_values('Investment_Focus', ascending=False, kind='stable')
+    keys = ['Volume', 'Priority', cac_bin.rename('CAC_Bin').loc[biggest.index]]
+    grouped = biggest.groupby(keys, sort=False)
+    aggregated = grouped.agg(
+        Channel=('Channel', 'first'),
+        CAC=('CAC', 'mean'),
+        Investment_Focus=('Investment_Focus', 'sum'),
+        Channels=('Channel', 'size'),
+    ).reset_index()
+    aggregated['CAC'] = aggregated['CAC'].round()
+    more = aggregated['Channels'] > 1
+    aggregated.loc[more, 'Channel'] = (aggregated.loc[more, 'Channel'] + ' +'
+                                       + (aggregated.loc[more, 'Channels'] - 1).astype(str))
+    return aggregated.drop(columns='CAC_Bin')
@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+
+# Feature matrix analytics on bit-packed rows.
+#
+# The `features` frame is laid out as one row per feature and one column per
+# product. Every product is packed into a row of uint64 words (feature j lives
+# in bit j % 64 of word j // 64) so subset and coverage checks become a handful
+# of vectorized AND/NOT/popcount passes, even at 500 features x 10k products.
+
+if hasattr(np, 'bitwise_count'):
+    def _popcount(words):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+else:
+    _BYTE_COUNTS = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def _popcount(words):
+        as_bytes = np.ascontiguousarray(words).view(np.uint8)
+        return _BYTE_COUNTS[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+def pack_features(features, feature_col='Feature'):
+    """Pack a features x products 0/1 frame into (rows, products, feature_names)."""
+    matrix = features.set_index(feature_col)
+    bits = matrix.fillna(0).to_numpy(dtype=bool).T
+    n_words = max(1, -(-bits.shape[1] // 64))
+    packed = np.packbits(bits, axis=1, bitorder='little')
+    padded = np.zeros((bits.shape[0], n_words * 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    return padded.view('<u8'), list(matrix.columns), list(matrix.index)
+
+
+def _unpack(rows, n_features):
+    as_bytes = np.ascontiguousarray(rows).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=n_features, bitorder='little').astype(bool)
+
+
+def _split(packed, target):
+    rows, products, feature_names = packed
+    target_idx = products.index(target)
+    competitor_idx = np.array([i for i in range(len(products)) if i != target_idx], dtype=np.intp)
+    return rows[target_idx], rows[competitor_idx], competitor_idx
+
+
+def _single_bit_index(words):
+    # Index of the only set bit in each row (rows must have popcount == 1)
+    word_idx = np.argmax(words != 0, axis=1)
+    word = words[np.arange(len(words)), word_idx]
+    return word_idx * 64 + np.log2(word.astype(np.float64)).astype(np.intp)
+
+
+def coverage_summary(packed, target='Stoki'):
+    """Feature counts for the target versus the competitor average."""
+    target_row, competitor_rows, _ = _split(packed, target)
+    n_features = len(packed[2])
+    target_count = int(_popcount(target_row))
+    competitor_avg = float(_popcount(competitor_rows).mean()) if len(competitor_rows) else 0.0
+    return {
+        'n_features': n_features,
+        'target_count': target_count,
+        'target_coverage': target_count / n_features * 100 if n_features else 0.0,
+        'competitor_avg': competitor_avg,
+        'competitor_coverage': competitor_avg / n_features * 100 if n_features else 0.0,
+        'advantage': target_count - competitor_avg,
+    }
+
+
+def dominated_competitors(packed, target='Stoki'):
+    """Competitors whose feature set is a strict subset of the target's."""
+    target_row, competitor_rows, competitor_idx = _split(packed, target)
+    subset = ~np.any(competitor_rows & ~target_row, axis=1)
+    strict = _popcount(competitor_rows) < _popcount(target_row)
+    products = packed[1]
+    return [products[i] for i in competitor_idx[subset & strict]]
+
+
+def minimal_winning_set(packed, target='Stoki', share=0.8):
+    """Greedy smallest subset of the target's features that beats `share` of competitors.
+
+    A feature set beats a competitor when it strictly contains the competitor's
+    features. Only competitors the target itself dominates are reachable, so the
+    returned share can fall short of the requested one.
+
+    Returns (feature_names, beaten_products, achieved_share).
+    """
+    target_row, competitor_rows, competitor_idx = _split(packed, target)
+    _, products, feature_names = packed
+    n_competitors = len(competitor_rows)
+    if n_competitors == 0:
+        return [], [], 0.0
+
+    needed = int(np.ceil(share * n_competitors))
+    reachable = ~np.any(competitor_rows & ~target_row, axis=1)
+    candidates = competitor_rows[reachable]
+    union = np.zeros_like(target_row)
+    covered = np.zeros(len(candidates), dtype=bool)
+
+    # Every non-trivial step adds at least one feature, so this loops at most
+    # n_features times; subsets of the running union are absorbed for free.
+    while len(candidates):
+        cost = _popcount(candidates & ~union)
+        covered |= cost == 0
+        if covered.sum() >= needed or covered.all():
+            break
+        pick = np.argmin(np.where(covered, np.iinfo(np.int64).max, cost))
+        union |= candidates[pick]
+
+    # Competitors equal to the union are tied, not beaten: add the target
+    # feature that the fewest competitors have.
+    union_size = _popcount(union)
+    candidate_sizes = _popcount(candidates)
+    if np.any(covered & (candidate_sizes == union_size)):
+        spare = _unpack((target_row & ~union)[None, :], len(feature_names))[0]
+        if spare.any():
+            prevalence = _unpack(competitor_rows, len(feature_names)).sum(axis=0)
+            extra = np.flatnonzero(spare)[np.argmin(prevalence[spare])]
+            union[extra // 64] |= np.uint64(1) << np.uint64(extra % 64)
+
+    beaten = ~np.any(competitor_rows & ~union, axis=1) & (_popcount(competitor_rows) < _popcount(union))
+    chosen = np.flatnonzero(_unpack(union[None, :], len(feature_names))[0])
+    return (
+        [feature_names[i] for i in chosen],
+        [products[i] for i in competitor_idx[beaten]],
+        float(beaten.sum() / n_competitors),
+    )
+
+
+def greedy_roadmap(packed, target='Stoki'):
+    """Order the target's features to maximize competitors beaten per shipped feature.
+
+    At each step the feature that newly beats the most competitors is shipped.
+    Ties (typically early on, when no single feature beats anyone yet) go to
+    the feature that moves the closest unbeaten competitors nearer to being
+    beaten, then to the one that cuts the most total residual cost.
+    """
+    target_row, competitor_rows, _ = _split(packed, target)
+    feature_names = packed[2]
+    n_features = len(feature_names)
+    n_competitors = len(competitor_rows)
+
+    have = _unpack(competitor_rows, n_features)
+    remaining = _unpack(target_row[None, :], n_features)[0]
+    competitor_sizes = _popcount(competitor_rows)
+    shipped = np.zeros_like(target_row)
+    beaten = np.zeros(n_competitors, dtype=bool)
+    unbeaten_have = have.sum(axis=0)
+
+    steps = []
+    while remaining.any():
+        shipped_size = len(steps)
+        residual = competitor_rows & ~shipped
+        residual_size = _popcount(residual)
+
+        # Adding f beats c when c \ shipped is {f} (or empty) and |c| <= |shipped|
+        open_ = ~beaten & (competitor_sizes <= shipped_size)
+        single = open_ & (residual_size == 1)
+        gain = np.zeros(n_features, dtype=np.int64)
+        if single.any():
+            gain += np.bincount(_single_bit_index(residual[single]), minlength=n_features)
+        gain += np.count_nonzero(open_ & (residual_size == 0))
+
+        # Steps still needed to beat c: cover its residual and outgrow it
+        need = np.maximum(residual_size, competitor_sizes + 1 - shipped_size)
+        closest = ~beaten
+        if closest.any():
+            closest &= need == need[closest].min()
+        toward_closest = _unpack(residual[closest], n_features).sum(axis=0)
+
+        # Lexicographic (gain, toward_closest, residual reduction); for an
+        # unshipped feature the reduction is the unbeaten competitors having it
+        weight = n_competitors + 1
+        score = (gain * weight + toward_closest) * weight + unbeaten_have
+        score = np.where(remaining, score, -1)
+        pick = int(np.argmax(score))
+
+        shipped[pick // 64] |= np.uint64(1) << np.uint64(pick % 64)
+        remaining[pick] = False
+        now_beaten = ~np.any(competitor_rows & ~shipped, axis=1) & (competitor_sizes < shipped_size + 1)
+        newly = now_beaten & ~beaten
+        unbeaten_have -= have[newly].sum(axis=0)
+        beaten |= now_beaten
+        steps.append((feature_names[pick], int(newly.sum()), int(beaten.sum())))
+
+    return pd.DataFrame(steps, columns=['Feature', 'Newly_Beaten', 'Cumulative_Beaten'])
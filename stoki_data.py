@@ -0,0 +1,290 @@
+import numpy as np
+import pandas as pd
+
+# Order of the frames returned by generate_stoki_data() / generate_scaled_data()
+DATA_FIELDS = (
+    'market_fundamentals', 'competitors_data', 'features', 'positioning', 'segments',
+    'results', 'pain_points', 'channels', 'timeline_data'
+)
+
+
+# Generate synthetic data
+def generate_stoki_data():
+    # Market fundamentals
+    market_fundamentals = pd.DataFrame({
+        'Metric': ['Total Addressable Market (TAM)', 'Serviceable Addressable Market (SAM)', 
+                   'Serviceable Obtainable Market (SOM)', 'Current Market Penetration'],
+        'Value': [750000, 250000, 40000, 16000],
+        'Unit': ['SMMEs', 'SMMEs', 'SMMEs', 'SMMEs'],
+        'Description': ['Total SA SMMEs with internet', 'Metro SMMEs > R1M turnover', 
+                       'Year 1-3 Target (16% of SAM)', 'Currently using digital tools']
+    })
+    
+    # Competitor financial data
+    competitors_data = pd.DataFrame({
+        'Company': ['Invoicely', 'ZazuPay', 'SA-Books', 'QuickStoki', 'CapitFlow', 'Stoki (Target)'],
+        'Revenue_Q2_2024_R_M': [2.5, 1.7, 1.7, 1.4, 1.4, 0.0],
+        'Market_Share': [25.8, 17.5, 17.5, 14.4, 14.4, 0.0],
+        'YoY_Growth': [66.7, 54.5, 13.3, 40.0, 133.3, 0.0],
+        'Customers': [8200, 6500, 9000, 12000, 3500, 0],
+        'ARPU_Monthly': [305, 262, 189, 117, 400, 349],
+        'CAC': [800, 650, 400, 250, 1200, 550],
+        'Funding_Raised_R_M': [18.0, 8.5, 5.0, 0, 22.0, 0],
+        'Valuation_R_M': [95.0, 45.0, 35.0, 25.0, 120.0, 0]
+    })
+    
+    # Calculate profitability
+    competitors_data['Profit_Margin'] = [28.1, 15.0, 14.7, 35.7, 10.7, 0]
+    competitors_data['CAC_Payback_Months'] = competitors_data['CAC'] / competitors_data['ARPU_Monthly']
+    
+    # Feature matrix
+    features = pd.DataFrame({
+        'Feature': ['Invoicing', 'Expense Tracking', 'Cashflow Forecasting', 
+                   'VAT Submission', 'Bank Integration', 'Beautiful UX', 'Mobile App'],
+        'Invoicely': [1, 1, 0, 1, 1, 0, 1],
+        'ZazuPay': [1, 1, 0, 0, 0, 1, 1],
+        'SA-Books': [1, 1, 0, 1, 1, 0, 0],
+        'QuickStoki': [1, 0, 0, 0, 0, 0, 1],
+        'CapitFlow': [0, 0, 1, 0, 1, 1, 1],
+        'Stoki': [1, 1, 1, 1, 1, 1, 1]
+    })
+    
+    # Competitive positioning
+    positioning = pd.DataFrame({
+        'Company': ['QuickStoki', 'ZazuPay', 'SA-Books', 'CapitFlow', 'Invoicely', 'Stoki (Target)'],
+        'X_Feature_Score': [2.1, 6.8, 5.5, 8.2, 7.0, 8.5],
+        'Y_Price_Index': [2.0, 4.5, 7.9, 8.9, 6.0, 5.0],
+        'Bubble_Size_Customers': [12000, 6500, 9000, 3500, 8200, 0],
+        'Quadrant': ['Budget-Basic', 'Value-Advanced', 'Premium-Complex', 
+                    'Premium-Complex', 'Premium-Complex', 'Value-Advanced']
+    })
+    
+    # Target segments
+    segments = pd.DataFrame({
+        'Segment': ['Micro (1-10 employees)', 'Small (11-50 employees)', 'Medium (51-200 employees)'],
+        'Market_Size': [65, 30, 5],
+        'Current_Digital_Adoption': [12, 25, 40],
+        'ARPU_Potential': [150, 349, 699],
+        'CAC': [200, 550, 1200],
+        'Growth_Rate': [20, 35, 15]
+    })
+    
+    # Initial results
+    results = pd.DataFrame({
+        'Metric': ['Business Signups (Q1)', 'Monthly Recurring Revenue (MRR)', 
+                  'Customer Acquisition Cost (CAC)', 'CAC Payback Period',
+                  'Customer Satisfaction', 'Feature Development Progress'],
+        'Current': [217, 75000, 520, 6.2, 4.2, 70],
+        'Target': [200, 100000, 600, 9, 4.5, 100],
+        'Unit': ['businesses', 'R/month', 'R', 'months', '/5.0', '%']
+    })
+    
+    # Pain points analysis
+    pain_points = pd.DataFrame({
+        'Pain_Point': ['Late payments from clients', 'Time spent on admin/invoicing/VAT',
+                      'Understanding cash flow', 'Paying suppliers'],
+        'Prevalence': [45, 30, 15, 10],
+        'Addressed_by_Stoki': [True, True, True, False],
+        'Priority': [1, 1, 1, 2]
+    })
+    
+    # Acquisition channels
+    channels = pd.DataFrame({
+        'Channel': ['Content Marketing', 'Accountant Partnerships', 'LinkedIn Ads', 
+                   'SEO', 'Referral Program', 'Industry Events'],
+        'CAC': [400, 300, 850, 200, 150, 1200],
+        'Volume': ['High', 'Medium', 'Low', 'High', 'Medium', 'Low'],
+        'Priority': [1, 1, 2, 1, 2, 3],
+        'Investment_Focus': [30, 30, 20, 30, 20, 10]
+    })
+    
+    # Implementation timeline
+    timeline_data = pd.DataFrame({
+        'Task': ['Market Research', 'MVP Development', 'Beta Testing', 
+                'Channel Setup', 'Full Launch', 'Scale Operations'],
+        'Start': ['2024-01-01', '2024-02-01', '2024-04-01', 
+                 '2024-05-01', '2024-07-01', '2024-10-01'],
+        'End': ['2024-01-31', '2024-03-31', '2024-06-30', 
+               '2024-06-30', '2024-09-30', '2025-03-31'],
+        'Status': ['Completed', 'Completed', 'In Progress', 
+                  'In Progress', 'Planned', 'Planned']
+    })
+    
+    timeline_data['Start'] = pd.to_datetime(timeline_data['Start'])
+    timeline_data['End'] = pd.to_datetime(timeline_data['End'])
+    
+    return (market_fundamentals, competitors_data, features, positioning, segments, results, pain_points,
+            channels, timeline_data)
+
+
+# Scaled synthetic data for benchmarking
+#
+# Produces the same nine frames as generate_stoki_data(), with the same
+# columns, at `scale` times the demo row counts (features are capped at
+# MAX_SCALED_FEATURES). Every column is drawn in one vectorized
+# call from a seeded generator, so equal (scale, seed) give equal frames.
+
+MAX_SCALED_FEATURES = 500
+
+_BASE_FEATURES = ['Invoicing', 'Expense Tracking', 'Cashflow Forecasting',
+                  'VAT Submission', 'Bank Integration', 'Beautiful UX', 'Mobile App']
+_BASE_RESULTS = ['Business Signups', 'Monthly Recurring Revenue', 'Customer Acquisition Cost',
+                 'CAC Payback Period', 'Customer Satisfaction', 'Feature Development Progress']
+_RESULT_UNITS = ['businesses', 'R/month', 'R', 'months', '/5.0', '%']
+# Ceiling of each metric's scale (satisfaction is out of 5, progress out of 100%)
+_RESULT_MAX = [np.inf, np.inf, np.inf, np.inf, 5.0, 100.0]
+_BASE_PAIN_POINTS = ['Late payments from clients', 'Time spent on admin/invoicing/VAT',
+                     'Understanding cash flow', 'Paying suppliers']
+_BASE_CHANNELS = ['Content Marketing', 'Accountant Partnerships', 'LinkedIn Ads',
+                  'SEO', 'Referral Program', 'Industry Events']
+_SURVEY_TEMPLATES = [
+    # (pain point share, phrasings)
+    (45, ['Clients pay late every month', 'Chasing clients for overdue invoices',
+          'Too many unpaid invoices', 'Customers owe us money for 90+ days']),
+    (30, ['Too much admin and paperwork', 'Invoicing takes hours each week',
+          'VAT returns are a nightmare', 'Bookkeeping eats my weekends']),
+    (15, ['No idea what our cash flow looks like', 'Hard to forecast next month',
+          'Not sure where the money is going']),
+    (10, ['Paying suppliers on time', 'Supplier payments bounce',
+          'Keeping vendors happy is hard']),
+    (10, ['Nothing really', 'The app crashes sometimes', 'Need better customer support']),
+]
+_VOLUMES = np.array(['High', 'Medium', 'Low'])
+_STATUSES = np.array(['Completed', 'In Progress', 'Planned'])
+
+
+def _names(base, n):
+    # Base names first, then numbered variants: "SEO", ..., "SEO #2", ...
+    base = np.asarray(base, dtype=object)
+    idx = np.arange(n)
+    names = base[idx % len(base)]
+    round_ = idx // len(base)
+    suffix = np.where(round_ > 0, np.char.add(' #', (round_ + 1).astype(str)), '')
+    return np.char.add(names.astype(str), suffix)
+
+
+def _percent_shares(weights, decimals=2):
+    # Largest-remainder rounding, so the rounded shares still sum to 100
+    unit = 10 ** decimals
+    exact = weights / weights.sum() * 100 * unit
+    shares = np.floor(exact)
+    short = int(round(100 * unit - shares.sum()))
+    shares[np.argsort(shares - exact, kind='stable')[:short]] += 1
+    return shares / unit
+
+
+def generate_scaled_data(scale=1, seed=0):
+    rng = np.random.default_rng(seed)
+    scale = max(1, int(scale))
+    
+    # Market fundamentals (values grow with the market)
+    market_fundamentals, *_ = generate_stoki_data()
+    market_fundamentals['Value'] = market_fundamentals['Value'] * scale
+    
+    # Competitors: lognormal revenue and customer counts, Stoki target last
+    n_comp = 5 * scale
+    companies = np.char.add('Competitor ', np.char.zfill(np.arange(1, n_comp + 1).astype(str), 5))
+    revenue = np.round(rng.lognormal(0.3, 0.5, n_comp), 1)
+    arpu = rng.integers(100, 451, n_comp)
+    cac = np.round(arpu * rng.uniform(1.5, 4.0, n_comp)).astype(int)
+    competitors_data = pd.DataFrame({
+        'Company': np.append(companies, 'Stoki (Target)'),
+        'Revenue_Q2_2024_R_M': np.append(revenue, 0.0),
+        'Market_Share': np.append(np.round(revenue / revenue.sum() * 100, 1), 0.0),
+        'YoY_Growth': np.append(np.round(rng.normal(50, 35, n_comp).clip(-20, 200), 1), 0.0),
+        'Customers': np.append(np.round(rng.lognormal(8.8, 0.5, n_comp)).astype(int), 0),
+        'ARPU_Monthly': np.append(arpu, 349),
+        'CAC': np.append(cac, 550),
+        'Funding_Raised_R_M': np.append(np.round(rng.exponential(10, n_comp), 1), 0),
+        'Valuation_R_M': np.append(np.round(revenue * rng.uniform(15, 60, n_comp), 1), 0)
+    })
+    competitors_data['Profit_Margin'] = np.append(np.round(rng.uniform(5, 40, n_comp), 1), 0)
+    competitors_data['CAC_Payback_Months'] = competitors_data['CAC'] / competitors_data['ARPU_Monthly']
+    
+    # Feature matrix: per-feature prevalence x per-product breadth, Stoki has everything
+    n_features = min(len(_BASE_FEATURES) * scale, MAX_SCALED_FEATURES)
+    prevalence = rng.beta(2, 3, n_features)
+    breadth = rng.beta(2, 2, n_comp)
+    available = rng.random((n_features, n_comp)) < np.clip(prevalence[:, None] * breadth[None, :] * 2, 0, 1)
+    matrix = np.hstack([available, np.ones((n_features, 1), dtype=bool)]).astype(np.int8)
+    features = pd.DataFrame(matrix, columns=np.append(companies, 'Stoki'))
+    features.insert(0, 'Feature', _names(_BASE_FEATURES, n_features))
+    
+    # Positioning: price tracks feature score with noise
+    x_score = np.round(rng.uniform(1, 9.5, n_comp), 1)
+    y_price = np.round(np.clip(x_score * 0.7 + rng.normal(1.5, 1.5, n_comp), 1, 10), 1)
+    quadrant = np.where(y_price >= 5, 'Premium-Complex',
+                        np.where(x_score >= 5, 'Value-Advanced', 'Budget-Basic'))
+    positioning = pd.DataFrame({
+        'Company': np.append(companies, 'Stoki (Target)'),
+        'X_Feature_Score': np.append(x_score, 8.5),
+        'Y_Price_Index': np.append(y_price, 5.0),
+        'Bubble_Size_Customers': competitors_data['Customers'].to_numpy(),
+        'Quadrant': np.append(quadrant, 'Value-Advanced')
+    })
+    
+    # Segments: market shares sum to 100
+    n_seg = 3 * scale
+    segments = pd.DataFrame({
+        'Segment': np.char.add('Segment ', np.arange(1, n_seg + 1).astype(str)),
+        'Market_Size': _percent_shares(rng.dirichlet(np.ones(n_seg))),
+        'Current_Digital_Adoption': rng.integers(5, 60, n_seg),
+        'ARPU_Potential': rng.integers(100, 900, n_seg),
+        'CAC': rng.integers(150, 1500, n_seg),
+        'Growth_Rate': rng.integers(5, 50, n_seg)
+    })
+    
+    # Results: current values scattered around their targets
+    n_res = len(_BASE_RESULTS) * scale
+    ceiling = np.tile(_RESULT_MAX, scale)
+    target = np.minimum(np.tile([200, 100000, 600, 9, 4.5, 100], scale) * rng.uniform(0.5, 2.0, n_res), ceiling)
+    results = pd.DataFrame({
+        'Metric': _names(_BASE_RESULTS, n_res),
+        'Current': np.round(np.minimum(target * rng.uniform(0.4, 1.3, n_res), ceiling), 1),
+        'Target': np.round(target, 1),
+        'Unit': np.tile(_RESULT_UNITS, scale)
+    })
+    
+    # Pain points: prevalence shares sum to 100
+    n_pain = len(_BASE_PAIN_POINTS) * scale
+    pain_points = pd.DataFrame({
+        'Pain_Point': _names(_BASE_PAIN_POINTS, n_pain),
+        'Prevalence': _percent_shares(rng.dirichlet(np.ones(n_pain))),
+        'Addressed_by_Stoki': rng.random(n_pain) < 0.75,
+        'Priority': rng.integers(1, 3, n_pain)
+    })
+    
+    # Channels
+    n_chan = len(_BASE_CHANNELS) * scale
+    channels = pd.DataFrame({
+        'Channel': _names(_BASE_CHANNELS, n_chan),
+        'CAC': rng.integers(100, 1300, n_chan),
+        'Volume': rng.choice(_VOLUMES, n_chan),
+        'Priority': rng.integers(1, 4, n_chan),
+        'Investment_Focus': rng.choice([10, 20, 30], n_chan)
+    })
+    
+    # Timeline tasks spread over two years
+    n_task = 6 * scale
+    start = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 640, n_task), unit='D')
+    timeline_data = pd.DataFrame({
+        'Task': np.char.add('Task ', np.char.zfill(np.arange(1, n_task + 1).astype(str), 5)),
+        'Start': start,
+        'End': start + pd.to_timedelta(rng.integers(14, 180, n_task), unit='D'),
+        'Status': rng.choice(_STATUSES, n_task)
+    })
+    
+    return (market_fundamentals, competitors_data, features, positioning, segments, results, pain_points,
+            channels, timeline_data)
+
+
+def generate_survey_responses(n, seed=0):
+    # Free-text survey answers; roughly the demo pain-point mix plus 10% noise
+    rng = np.random.default_rng(seed)
+    weights = np.array([share for share, _ in _SURVEY_TEMPLATES], dtype=float)
+    phrases = np.array([phrase for _, group in _SURVEY_TEMPLATES for phrase in group], dtype=object)
+    sizes = np.array([len(group) for _, group in _SURVEY_TEMPLATES])
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    group = rng.choice(len(_SURVEY_TEMPLATES), size=n, p=weights / weights.sum())
+    phrase = offsets[group] + (rng.random(n) * sizes[group]).astype(int)
+    return pd.Series(phrases[phrase], name='Response')
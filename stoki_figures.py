@@ -0,0 +1,364 @@
+import inspect
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from stoki_aggregation import (top_k_with_other, aggregate_channels, PAIN_POINT_TOP_K,
+                               CHANNEL_LABEL_LIMIT)
+
+# Figure builders for each dashboard view.
+#
+# Builders take the frames they need (named as in stoki_data.DATA_FIELDS) and
+# return a dict of plotly figures, so they can be run and timed without a
+# Streamlit session.
+
+
+def build_market_overview_figures(pain_points):
+    # Market funnel visualization
+    funnel = go.Figure(go.Funnel(
+        y = ["TAM (750,000)", "SAM (250,000)", "SOM (40,000)", "Current (16,000)"],
+        x = [750000, 250000, 40000, 16000],
+        textposition = "inside",
+        textinfo = "value+percent initial",
+        marker = {"color": ["#1E3A8A", "#3B82F6", "#60A5FA", "#93C5FD"]}
+    ))
+
+    funnel.update_layout(
+        title="Market Segmentation Funnel",
+        showlegend=False,
+        height=400
+    )
+
+    # Pain points analysis (top categories only, the rest summed into "Other")
+    pain_points = top_k_with_other(pain_points, 'Prevalence', 'Pain_Point', PAIN_POINT_TOP_K,
+                                   other_values={'Addressed_by_Stoki': False})
+    fig = px.bar(
+        pain_points,
+        x='Pain_Point',
+        y='Prevalence',
+        color='Priority',
+        title='Top SMME Financial Pain Points',
+        color_continuous_scale='Blues',
+        text='Prevalence'
+    )
+
+    fig.update_traces(texttemplate='%{text}%', textposition='outside')
+    fig.update_layout(
+        xaxis_title="Pain Point",
+        yaxis_title="Prevalence (%)",
+        # Headroom for the outside labels; "Other" can dwarf the demo's 45%
+        yaxis_range=[0, max(50, pain_points['Prevalence'].max() * 1.15)]
+    )
+
+    # Add Stoki addressing indicators as a single text trace
+    addressed = pain_points[pain_points['Addressed_by_Stoki'].astype(bool)]
+    fig.add_trace(go.Scatter(
+        x=addressed['Pain_Point'],
+        y=addressed['Prevalence'] + 2,
+        mode='text',
+        text="✓ Addressed by Stoki",
+        textfont=dict(color="green", size=10),
+        hoverinfo='skip',
+        showlegend=False
+    ))
+
+    return {'funnel': funnel, 'pain_points': fig}
+
+
+def build_competitive_landscape_figures(competitors_data, features):
+    market_share = px.bar(
+        competitors_data[competitors_data['Company'] != 'Stoki (Target)'],
+        x='Company',
+        y='Market_Share',
+        color='YoY_Growth',
+        title='Market Share & Growth',
+        text='Market_Share',
+        color_continuous_scale='RdYlGn'
+    )
+    market_share.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+    market_share.update_layout(yaxis_title="Market Share (%)")
+
+    arpu_cac = px.scatter(
+        competitors_data,
+        x='ARPU_Monthly',
+        y='CAC',
+        size='Customers',
+        color='Company',
+        title='ARPU vs CAC (Bubble size = Customers)',
+        hover_data=['Profit_Margin', 'CAC_Payback_Months']
+    )
+
+    # Add Stoki target line
+    arpu_cac.add_hline(y=550, line_dash="dash", line_color="blue",
+                 annotation_text="Stoki Target CAC")
+    arpu_cac.add_vline(x=349, line_dash="dash", line_color="blue",
+                 annotation_text="Stoki Target ARPU")
+
+    # Build a pivot table: rows = Features, columns = Companies, values = availability (0/1)
+    feature_matrix = features.set_index('Feature').notna().astype(int)
+    # Plot as heatmap
+    heatmap = px.imshow(feature_matrix, labels=dict(x="Company", y="Feature", color="Available"), x=feature_matrix.columns,
+    y=feature_matrix.index, color_continuous_scale='RdYlGn', aspect="auto", title="Competitive Feature Matrix")
+    # Highlight Stoki column if present
+    if 'Stoki' in feature_matrix.columns:heatmap.update_xaxes(tickangle=45, tickfont=dict(color="blue", size=12)
+    )
+
+    return {'market_share': market_share, 'arpu_cac': arpu_cac, 'feature_matrix': heatmap}
+
+
+def build_segmentation_figures(segments):
+    # Segment comparison
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Market Size Distribution', 'Digital Adoption Rate',
+                       'ARPU Potential', 'CAC by Segment'),
+        specs=[[{'type': 'pie'}, {'type': 'bar'}],
+               [{'type': 'bar'}, {'type': 'bar'}]]
+    )
+
+    # Pie chart for market size
+    fig.add_trace(
+        go.Pie(labels=segments['Segment'], values=segments['Market_Size'],
+               name="Market Size", marker_colors=['#60A5FA', '#3B82F6', '#1D4ED8']),
+        row=1, col=1
+    )
+
+    # Bar chart for digital adoption
+    fig.add_trace(
+        go.Bar(x=segments['Segment'], y=segments['Current_Digital_Adoption'],
+               name="Digital Adoption", marker_color='#10B981'),
+        row=1, col=2
+    )
+
+    # Bar chart for ARPU potential
+    fig.add_trace(
+        go.Bar(x=segments['Segment'], y=segments['ARPU_Potential'],
+               name="ARPU Potential", marker_color='#F59E0B'),
+        row=2, col=1
+    )
+
+    # Bar chart for CAC
+    fig.add_trace(
+        go.Bar(x=segments['Segment'], y=segments['CAC'],
+               name="CAC", marker_color='#EF4444'),
+        row=2, col=2
+    )
+
+    fig.update_layout(height=700, showlegend=False)
+    fig.update_yaxes(title_text="Percentage", row=1, col=2)
+    fig.update_yaxes(title_text="Rands", row=2, col=1)
+    fig.update_yaxes(title_text="Rands", row=2, col=2)
+
+    return {'segments': fig}
+
+
+def build_positioning_figures(positioning):
+    # Create positioning map
+    fig = px.scatter(
+        positioning,
+        x='X_Feature_Score',
+        y='Y_Price_Index',
+        size='Bubble_Size_Customers',
+        color='Company',
+        hover_data=['Quadrant'],
+        title='Strategic Positioning: Feature Score vs Price Index',
+        size_max=60
+    )
+
+    # Add quadrant lines
+    fig.add_hline(y=5, line_dash="dash", line_color="gray", opacity=0.7)
+    fig.add_vline(x=5, line_dash="dash", line_color="gray", opacity=0.7)
+
+    # Add quadrant labels
+    fig.add_annotation(x=3, y=8, text="Premium-Complex", showarrow=False, font=dict(size=10))
+    fig.add_annotation(x=3, y=2, text="Budget-Basic", showarrow=False, font=dict(size=10))
+    fig.add_annotation(x=8, y=8, text="Premium-Advanced", showarrow=False, font=dict(size=10))
+    fig.add_annotation(x=8, y=2, text="Value-Advanced", showarrow=False, font=dict(size=10))
+
+    # Highlight Stoki's target position
+    fig.add_shape(type="circle",
+        xref="x", yref="y",
+        x0=8, y0=4.5, x1=9, y1=5.5,
+        line=dict(color="blue", width=2, dash="dot"),
+    )
+
+    fig.update_layout(
+        xaxis_title="Feature Score & Quality →",
+        yaxis_title="Price Index →",
+        height=600
+    )
+
+    # Pricing strategy
+    pricing_data = pd.DataFrame({
+        'Tier': ['Stoki Basic', 'Stoki Pro', 'Competitor Average', 'Market Leader'],
+        'Price': [199, 349, 299, 599],
+        'Features': ['Invoicing + Expenses', 'Full Suite + Cashflow', 'Limited Suite', 'Complex Suite']
+    })
+
+    pricing = px.bar(
+        pricing_data,
+        x='Tier',
+        y='Price',
+        color='Tier',
+        text='Price',
+        title='Competitive Pricing Positioning',
+        color_discrete_sequence=['#60A5FA', '#3B82F6', '#9CA3AF', '#6B7280']
+    )
+
+    pricing.update_traces(texttemplate='R%{text}/month', textposition='outside')
+    pricing.update_layout(
+        yaxis_title="Monthly Price (R)",
+        showlegend=False
+    )
+
+    # Add value indicator
+    pricing.add_annotation(
+        x='Stoki Pro',
+        y=400,
+        text="✓ Best Value",
+        showarrow=True,
+        arrowhead=2,
+        ax=0,
+        ay=-40,
+        font=dict(color="green", size=12)
+    )
+
+    return {'positioning_map': fig, 'pricing': pricing}
+
+
+def build_performance_figures():
+    growth_data = pd.DataFrame({
+        'Quarter': ['Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024'],
+        'Signups': [217, 350, 500, 700],
+        'MRR_R000': [75, 122, 175, 245],
+        'CAC': [520, 480, 450, 420]
+    })
+
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig.add_trace(
+        go.Bar(x=growth_data['Quarter'], y=growth_data['Signups'],
+               name="Business Signups", marker_color='#3B82F6'),
+        secondary_y=False
+    )
+
+    fig.add_trace(
+        go.Scatter(x=growth_data['Quarter'], y=growth_data['MRR_R000'],
+                  name="MRR (R'000)", mode='lines+markers', line=dict(color='#10B981', width=3)),
+        secondary_y=True
+    )
+
+    fig.update_layout(
+        title="Growth Projection - First Year",
+        xaxis_title="Quarter",
+        hovermode="x unified"
+    )
+
+    fig.update_yaxes(title_text="Business Signups", secondary_y=False)
+    fig.update_yaxes(title_text="MRR (R'000)", secondary_y=True)
+
+    return {'growth': fig}
+
+
+def build_progress_rows(results):
+    # Progress towards targets, one formatted row per metric
+    target = results['Target']
+    progress = (results['Current'] / target.where(target > 0) * 100).fillna(0)
+    return pd.DataFrame({
+        'Metric': results['Metric'],
+        'Current': results['Current'].astype(str) + ' ' + results['Unit'],
+        'Progress': (progress / 100).clip(upper=1.0),
+        'Caption': ('Target: ' + target.astype(str) + ' ' + results['Unit']
+                    + ' (' + progress.map('{:.0f}'.format) + '%)'),
+    })
+
+
+def build_roadmap_rows():
+    roadmap = pd.DataFrame({
+        'Phase': ['MVP Launch', 'Q2 2024', 'Q3 2024', 'Q4 2024'],
+        'Features': [
+            'Core invoicing + basic reporting',
+            'Expense tracking + VAT calculations',
+            'Cashflow forecasting + bank integrations',
+            'Advanced analytics + supplier payments'
+        ],
+        'Target_Users': ['Early adopters', 'Small businesses', 'Growing SMBs', 'Established businesses'],
+        'Status': ['✅ Completed', '🟡 In Progress', '🔜 Planned', '📅 Future']
+    })
+    # Which st alert each status is shown with
+    roadmap['Alert'] = roadmap['Status'].map({'✅ Completed': 'success', '🟡 In Progress': 'warning'}).fillna('info')
+    return roadmap
+
+
+def build_go_to_market_figures(channels, timeline_data):
+    # Large channel lists are binned into bubbles; only the biggest get labels
+    channels = aggregate_channels(channels)
+    label_all = len(channels) <= CHANNEL_LABEL_LIMIT
+    fig = px.scatter(
+        channels,
+        x='CAC',
+        y='Priority',
+        size='Investment_Focus',
+        color='Volume',
+        text='Channel' if label_all else None,
+        title='Channel Strategy: CAC vs Priority (Size = Investment Focus)',
+        color_discrete_sequence=['#10B981', '#F59E0B', '#EF4444'],
+        category_orders={'Volume': ['High', 'Medium', 'Low']}
+    )
+
+    if label_all:
+        fig.update_traces(textposition='top center')
+    else:
+        labelled = channels.nlargest(CHANNEL_LABEL_LIMIT, 'Investment_Focus')
+        fig.add_trace(go.Scatter(
+            x=labelled['CAC'],
+            y=labelled['Priority'],
+            mode='text',
+            text=labelled['Channel'],
+            textposition='top center',
+            hoverinfo='skip',
+            showlegend=False
+        ))
+    fig.update_layout(
+        xaxis_title="Customer Acquisition Cost (R)",
+        yaxis_title="Priority (1 = Highest)",
+        yaxis=dict(tickmode='array', tickvals=[1, 2, 3], ticktext=['High', 'Medium', 'Low'])
+    )
+
+    timeline = px.timeline(
+        timeline_data,
+        x_start="Start",
+        x_end="End",
+        y="Task",
+        color="Status",
+        title="Implementation Timeline",
+        color_discrete_map={
+            'Completed': '#10B981',
+            'In Progress': '#F59E0B',
+            'Planned': '#60A5FA'
+        }
+    )
+
+    timeline.update_yaxes(autorange="reversed")
+    timeline.update_layout(height=400)
+
+    return {'channels': fig, 'timeline': timeline}
+
+
+# View name -> figure builder, in sidebar order
+VIEW_FIGURES = {
+    "Market Overview": build_market_overview_figures,
+    "Competitive Landscape": build_competitive_landscape_figures,
+    "Target Segmentation": build_segmentation_figures,
+    "Positioning Strategy": build_positioning_figures,
+    "Performance Tracker": build_performance_figures,
+    "Go-to-Market Plan": build_go_to_market_figures,
+}
+
+
+def build_view_figures(view, data):
+    """Build one view's figures from a {field: frame} dict (see stoki_data.DATA_FIELDS)."""
+    builder = VIEW_FIGURES[view]
+    params = inspect.signature(builder).parameters
+    return builder(**{name: data[name] for name in params})
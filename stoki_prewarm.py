@@ -0,0 +1,212 @@
+"""Pre-warm the figure cache for every dashboard view.
+
+All six views' figures are built in a pool of worker processes and stored in
+a process-wide cache keyed by view and data version, so the first visitor of
+a view gets a cached figure instead of paying the build. Workers are fresh
+`python -m stoki_prewarm --build-view` processes fed pickled data on stdin:
+multiprocessing would re-run the app script in each child (Streamlit installs
+it as __main__), and figure building holds the GIL, so threads do not help.
+
+The dashboard calls prewarm() before rendering. On a cold cache that blocks,
+which is what holds Streamlit's script health check
+(/_stcore/script-health-check, enabled in .streamlit/config.toml) at "not
+ready" until the cache is warm. A data refresh changes the version; the new
+version is then built in the background without holding the cache lock and
+swapped in whole, so live sessions keep running (their views are built on
+demand until the swap).
+
+Pool size comes from STOKI_PREWARM_WORKERS (default: half the CPUs, at most
+one per view) so pre-warming leaves cores for live sessions; 0 builds inline
+in the calling thread, which is also the default below four CPUs. Run this
+module directly to time a pre-warm:
+
+    python stoki_prewarm.py --workers 4 --scale 100
+"""
+import argparse
+import hashlib
+import logging
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+from stoki_data import DATA_FIELDS, generate_scaled_data
+from stoki_figures import VIEW_FIGURES, build_view_figures
+
+logger = logging.getLogger(__name__)
+
+WORKERS_ENV = 'STOKI_PREWARM_WORKERS'
+
+# (view, version) -> {figure name: figure}; only one version is kept
+_figure_cache = {}
+_cache_version = None
+# Builds are numbered as they start; the cache holds build _cache_build.
+# version -> Event for builds in flight
+_builds_started = 0
+_cache_build = 0
+_warming = {}
+_cache_lock = threading.Lock()
+
+
+def default_workers():
+    configured = os.environ.get(WORKERS_ENV)
+    if configured is not None:
+        return max(0, int(configured))
+    # A single worker process is just inline building plus start-up cost
+    workers = min(len(VIEW_FIGURES), (os.cpu_count() or 1) // 2)
+    return workers if workers > 1 else 0
+
+
+def data_version(data):
+    """Content fingerprint of a {field: frame} dict, row order included."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(data):
+        frame = data[name]
+        if isinstance(frame, pd.DataFrame):
+            layout = (name, frame.shape, list(frame.columns), [str(dtype) for dtype in frame.dtypes])
+            digest.update(repr(layout).encode())
+            digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _timed_build(view, data):
+    start = time.perf_counter()
+    figures = build_view_figures(view, data)
+    return view, figures, time.perf_counter() - start
+
+
+def _build_in_worker(view, payload):
+    # The pool threads only wait on their worker process
+    result = subprocess.run(
+        [sys.executable, '-m', 'stoki_prewarm', '--build-view', view],
+        input=payload, capture_output=True, cwd=Path(__file__).resolve().parent,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Pre-warm worker for {view} failed:\n{result.stderr.decode(errors='replace')}")
+    return pickle.loads(result.stdout)
+
+
+def _build_views(data, workers):
+    built = {}
+    if workers == 0:
+        for view in VIEW_FIGURES:
+            view, figures, seconds = _timed_build(view, data)
+            built[view] = figures
+            logger.info("Pre-warmed %s in %.3fs", view, seconds)
+    else:
+        payload = pickle.dumps({name: data[name] for name in DATA_FIELDS if name in data})
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='stoki-prewarm') as pool:
+            futures = [pool.submit(_build_in_worker, view, payload) for view in VIEW_FIGURES]
+            for future in as_completed(futures):
+                view, figures, seconds = future.result()
+                built[view] = figures
+                logger.info("Pre-warmed %s in %.3fs", view, seconds)
+    return built
+
+
+def _warm(data, version, build, workers, done):
+    global _figure_cache, _cache_version, _cache_build
+    try:
+        start = time.perf_counter()
+        built = _build_views(data, workers)
+        with _cache_lock:
+            # Skip the swap only if a build started after this one is already in
+            if build > _cache_build:
+                _figure_cache = {(view, version): figures for view, figures in built.items()}
+                _cache_version = version
+                _cache_build = build
+        logger.info("Pre-warmed %d views with %d workers in %.3fs",
+                    len(built), workers, time.perf_counter() - start)
+    finally:
+        with _cache_lock:
+            del _warming[version]
+        done.set()
+
+
+def _warm_in_background(data, version, build, workers, done):
+    try:
+        _warm(data, version, build, workers, done)
+    except Exception:
+        logger.exception("Background pre-warm failed; views are built on demand")
+
+
+def prewarm(data, version=None, workers=None):
+    """Build every view's figures for `data` and swap them into the cache.
+
+    Figures are built outside the cache lock. On a cold cache this blocks
+    until the build is done (concurrent callers wait on the same build). Once
+    any version is cached, a data refresh warms the new version in a
+    background thread and returns at once; get_view_figures builds misses on
+    demand until the swap. Returns the data version.
+    """
+    global _builds_started
+    version = data_version(data) if version is None else version
+    workers = default_workers() if workers is None else workers
+
+    with _cache_lock:
+        if _cache_version == version:
+            return version
+        cold = _cache_version is None
+        builder = version not in _warming
+        if builder:
+            _builds_started += 1
+            build = _builds_started
+            _warming[version] = threading.Event()
+        done = _warming[version]
+
+    if builder and cold:
+        _warm(data, version, build, workers, done)
+    elif builder:
+        threading.Thread(target=_warm_in_background, args=(data, version, build, workers, done),
+                         name='stoki-prewarm', daemon=True).start()
+    elif cold:
+        done.wait()
+    return version
+
+
+def get_view_figures(view, data, version=None):
+    """Cached figures for one view, building them on a miss.
+
+    Misses are only cached for the current version; while a refresh warms in
+    the background they are rebuilt per call.
+    """
+    version = data_version(data) if version is None else version
+    with _cache_lock:
+        figures = _figure_cache.get((view, version))
+    if figures is None:
+        view, figures, seconds = _timed_build(view, data)
+        logger.info("Built %s on demand in %.3fs", view, seconds)
+        with _cache_lock:
+            if _cache_version == version:
+                _figure_cache[(view, version)] = figures
+    return figures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--build-view", choices=list(VIEW_FIGURES),
+                        help="worker mode: read pickled data on stdin, write pickled figures to stdout")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"pool size (default: ${WORKERS_ENV} or half the CPUs)")
+    parser.add_argument("--scale", type=int, default=1, help="synthetic data scale")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.build_view:
+        data = pickle.load(sys.stdin.buffer)
+        pickle.dump(_timed_build(args.build_view, data), sys.stdout.buffer)
+        return
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    data = dict(zip(DATA_FIELDS, generate_scaled_data(args.scale, args.seed)))
+    prewarm(data, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stoki_aggregation import (OTHER_LABEL, PAIN_POINT_PATTERNS, PAIN_POINT_TOP_K,  # noqa: E402
+                               classify_responses, count_pain_points, iter_batches,
+                               pain_point_summary)
+from stoki_data import generate_scaled_data, generate_stoki_data, generate_survey_responses  # noqa: E402
+from stoki_figures import build_market_overview_figures  # noqa: E402
+
+CATEGORIES = list(PAIN_POINT_PATTERNS) + [OTHER_LABEL]
+
+
+@pytest.mark.parametrize('response, category', [
+    ('Invoices are paid late', 'Late payments from clients'),
+    ('Clients always paid late', 'Late payments from clients'),
+    ("Client hasn't paid since March", 'Late payments from clients'),
+    ("Customers haven't paid their invoices", 'Late payments from clients'),
+    ('Customers havent paid', 'Late payments from clients'),
+    ('We have not been paid for two months', 'Late payments from clients'),
+    ('Invoices not paid on time', 'Late payments from clients'),
+    ("We haven't paid our suppliers yet", 'Paying suppliers'),
+    ('Suppliers not paid on time', 'Paying suppliers'),
+    ('Invoicing takes hours each week', 'Time spent on admin/invoicing/VAT'),
+    ('Hard to forecast next month', 'Understanding cash flow'),
+    ('Nothing really', OTHER_LABEL),
+])
+def test_classify_responses(response, category):
+    assert CATEGORIES[classify_responses([response])[0]] == category
+
+
+def test_survey_feed_reaches_market_overview_chart():
+    # A survey feed is streamed in batches, summarised against the pain-point
+    # metadata and charted; batch size must not change the counts
+    responses = pd.concat([generate_survey_responses(5000, seed=1),
+                           pd.Series(['Invoices are paid late'] * 500)], ignore_index=True)
+    pain_points = generate_stoki_data()[6]
+
+    counts = count_pain_points(iter_batches(responses, batch_size=777))
+    assert counts.equals(count_pain_points([responses]))
+    assert counts.sum() == len(responses)
+
+    summary = pain_point_summary(counts, pain_points)
+    assert summary['Pain_Point'].iloc[-1] == OTHER_LABEL
+    assert summary['Responses'].sum() == len(responses)
+
+    fig = build_market_overview_figures(summary)['pain_points']
+    bars = fig.data[0]
+    assert list(bars.x) == list(summary['Pain_Point'])
+    assert fig.layout.yaxis.range[1] > summary['Prevalence'].max()
+
+
+@pytest.mark.parametrize('scale', [1, 100])
+def test_pain_point_axis_fits_other_bar(scale):
+    pain_points = generate_scaled_data(scale, seed=0)[6]
+    fig = build_market_overview_figures(pain_points)['pain_points']
+
+    shown = max(max(trace.y) for trace in fig.data if len(trace.y))
+    assert len(fig.data[0].x) <= PAIN_POINT_TOP_K + 1
+    assert fig.layout.yaxis.range[1] > shown
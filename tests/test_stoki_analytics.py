@@ -0,0 +1,148 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stoki_analytics import (_single_bit_index, _popcount, coverage_summary,  # noqa: E402
+                             dominated_competitors, greedy_roadmap, minimal_winning_set,
+                             pack_features)
+
+
+def make_features(matrix, products=None):
+    # matrix: features x products 0/1, last product is the target
+    n_features, n_products = matrix.shape
+    products = products or [f'P{i}' for i in range(n_products - 1)] + ['Stoki']
+    features = pd.DataFrame(matrix.astype(int), columns=products)
+    features.insert(0, 'Feature', [f'f{i}' for i in range(n_features)])
+    return features
+
+
+def random_features(n_features, n_products, seed):
+    rng = np.random.default_rng(seed)
+    matrix = rng.random((n_features, n_products)) < 0.4
+    matrix[:, -1] = True
+    return make_features(matrix)
+
+
+def as_sets(features):
+    matrix = features.set_index('Feature')
+    return {product: set(matrix.index[matrix[product] == 1]) for product in matrix.columns}
+
+
+def beats(shipped, competitor):
+    return competitor <= shipped and len(competitor) < len(shipped)
+
+
+DEMO = make_features(np.array([
+    [1, 1, 1, 1, 0, 1],
+    [1, 1, 1, 0, 0, 1],
+    [0, 0, 0, 0, 1, 1],
+    [1, 0, 1, 0, 0, 1],
+    [1, 0, 1, 0, 1, 1],
+    [0, 1, 0, 0, 1, 1],
+    [1, 1, 0, 1, 1, 1],
+]), ['Invoicely', 'ZazuPay', 'SA-Books', 'QuickStoki', 'CapitFlow', 'Stoki'])
+
+
+@pytest.mark.parametrize('n_features', [7, 63, 64, 65, 140])
+def test_pack_features_round_trips_across_word_boundaries(n_features):
+    features = random_features(n_features, 9, seed=n_features)
+    rows, products, feature_names = pack_features(features)
+
+    assert rows.shape == (9, -(-n_features // 64))
+    assert products == list(features.columns[1:])
+    assert feature_names == list(features['Feature'])
+    bits = np.unpackbits(rows.view(np.uint8), axis=1, bitorder='little')
+    expected = features.set_index('Feature').to_numpy(dtype=bool).T
+    assert np.array_equal(bits[:, :n_features].astype(bool), expected)
+    assert not bits[:, n_features:].any()
+    assert np.array_equal(_popcount(rows), expected.sum(axis=1))
+
+
+@pytest.mark.parametrize('n_features', [7, 64, 140])
+def test_single_bit_index_finds_every_bit(n_features):
+    features = make_features(np.eye(n_features, dtype=bool))
+    rows, _, _ = pack_features(features)
+    assert np.array_equal(_single_bit_index(rows), np.arange(n_features))
+
+
+@pytest.mark.parametrize('n_features, seed', [(7, 0), (70, 1), (140, 2)])
+def test_coverage_and_domination_match_set_logic(n_features, seed):
+    features = random_features(n_features, 40, seed)
+    sets = as_sets(features)
+    target = sets.pop('Stoki')
+    packed = pack_features(features)
+
+    summary = coverage_summary(packed)
+    assert summary['target_count'] == len(target)
+    assert summary['competitor_avg'] == pytest.approx(np.mean([len(s) for s in sets.values()]))
+    assert dominated_competitors(packed) == [p for p, s in sets.items() if beats(target, s)]
+
+
+@pytest.mark.parametrize('n_features, seed, share', [(7, 3, 0.5), (70, 4, 0.8), (140, 5, 0.3)])
+def test_minimal_winning_set_beats_what_it_claims(n_features, seed, share):
+    rng = np.random.default_rng(seed)
+    # Sparse competitors so most are reachable
+    matrix = rng.random((n_features, 30)) < 0.1
+    matrix[:, -1] = True
+    features = make_features(matrix)
+    sets = as_sets(features)
+    target = sets.pop('Stoki')
+
+    chosen, beaten, achieved = minimal_winning_set(pack_features(features), share=share)
+
+    assert set(chosen) <= target
+    assert beaten == [p for p, s in sets.items() if beats(set(chosen), s)]
+    assert achieved == pytest.approx(len(beaten) / len(sets))
+    assert achieved >= share
+
+
+def test_minimal_winning_set_breaks_tie_with_rarest_spare_feature():
+    # A alone is the cheapest pick, but a union equal to A only ties it
+    features = make_features(np.array([
+        [1, 1, 1],
+        [1, 1, 1],
+        [0, 1, 1],
+        [0, 0, 1],
+    ]), ['A', 'B', 'Stoki'])
+
+    chosen, beaten, achieved = minimal_winning_set(pack_features(features), share=0.5)
+
+    assert chosen == ['f0', 'f1', 'f3']
+    assert beaten == ['A']
+    assert achieved == 0.5
+
+
+def test_minimal_winning_set_on_demo_tie():
+    # QuickStoki + ZazuPay union equals ZazuPay; an extra feature is needed
+    chosen, beaten, _ = minimal_winning_set(pack_features(DEMO), share=0.4)
+
+    sets = as_sets(DEMO)
+    assert 'ZazuPay' in beaten
+    assert beats(set(chosen), sets['ZazuPay'])
+
+
+@pytest.mark.parametrize('n_features, seed', [(7, 6), (70, 7), (140, 8)])
+def test_greedy_roadmap_counts_match_set_logic(n_features, seed):
+    features = random_features(n_features, 25, seed)
+    sets = as_sets(features)
+    target = sets.pop('Stoki')
+
+    roadmap = greedy_roadmap(pack_features(features))
+
+    assert sorted(roadmap['Feature']) == sorted(target)
+    shipped, cumulative = set(), []
+    for feature in roadmap['Feature']:
+        shipped.add(feature)
+        cumulative.append(sum(beats(shipped, s) for s in sets.values()))
+    assert roadmap['Cumulative_Beaten'].tolist() == cumulative
+    assert roadmap['Newly_Beaten'].tolist() == np.diff([0] + cumulative).tolist()
+
+
+def test_greedy_roadmap_demo_order_makes_early_progress():
+    roadmap = greedy_roadmap(pack_features(DEMO))
+    assert roadmap['Cumulative_Beaten'].tolist() == [0, 0, 1, 1, 2, 4, 5]
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stoki_data import DATA_FIELDS, generate_scaled_data  # noqa: E402
+
+
+@pytest.mark.parametrize('scale', [1, 100, 10000])
+def test_scaled_shares_sum_to_100(scale):
+    data = dict(zip(DATA_FIELDS, generate_scaled_data(scale, seed=0)))
+
+    for frame, col in ((data['segments'], 'Market_Size'), (data['pain_points'], 'Prevalence')):
+        assert frame[col].sum() == pytest.approx(100, abs=1e-6)
+        assert (frame[col] >= 0).all()
+        hundredths = frame[col] * 100
+        assert (hundredths - hundredths.round()).abs().max() < 1e-6
+
+
+@pytest.mark.parametrize('scale', [1, 100])
+def test_scaled_results_stay_within_metric_scale(scale):
+    results = generate_scaled_data(scale, seed=0)[5]
+
+    for unit, ceiling in (('/5.0', 5.0), ('%', 100.0)):
+        bounded = results[results['Unit'] == unit]
+        assert len(bounded) == scale
+        assert bounded['Target'].le(ceiling).all()
+        assert bounded['Current'].le(ceiling).all()
@@ -0,0 +1,123 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import stoki_prewarm  # noqa: E402
+from stoki_data import DATA_FIELDS, generate_stoki_data  # noqa: E402
+from stoki_figures import VIEW_FIGURES  # noqa: E402
+
+
+def demo_data():
+    return dict(zip(DATA_FIELDS, generate_stoki_data()))
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(stoki_prewarm, '_figure_cache', {})
+    monkeypatch.setattr(stoki_prewarm, '_cache_version', None)
+    monkeypatch.setattr(stoki_prewarm, '_builds_started', 0)
+    monkeypatch.setattr(stoki_prewarm, '_cache_build', 0)
+    monkeypatch.setattr(stoki_prewarm, '_warming', {})
+
+
+@pytest.fixture
+def gated_builds(monkeypatch):
+    # Figure builds wait until the returned event is set
+    gate = threading.Event()
+    gate.set()
+
+    def build(view, data):
+        assert gate.wait(10)
+        return {'view': view, 'rows': len(data['results'])}
+
+    monkeypatch.setattr(stoki_prewarm, 'build_view_figures', build)
+    return gate
+
+
+def test_data_version_depends_on_row_order():
+    data = demo_data()
+    shuffled = dict(data, results=data['results'].iloc[::-1].reset_index(drop=True))
+
+    assert stoki_prewarm.data_version(data) == stoki_prewarm.data_version(demo_data())
+    assert stoki_prewarm.data_version(data) != stoki_prewarm.data_version(shuffled)
+
+
+def test_data_version_depends_on_column_names_and_dtypes():
+    data = demo_data()
+    renamed = dict(data, results=data['results'].rename(columns={'Target': 'Goal'}))
+    narrowed = dict(data, results=data['results'].astype({'Target': 'float32'}))
+
+    versions = {stoki_prewarm.data_version(d) for d in (data, renamed, narrowed)}
+    assert len(versions) == 3
+
+
+def test_refresh_warms_in_background_without_blocking(empty_cache, gated_builds):
+    old = demo_data()
+    new = dict(old, results=old['results'].iloc[:2])
+    old_version = stoki_prewarm.prewarm(old, workers=0)
+    assert stoki_prewarm._cache_version == old_version
+
+    gated_builds.clear()
+    start = time.perf_counter()
+    new_version = stoki_prewarm.prewarm(new, workers=0)
+    assert time.perf_counter() - start < 1
+    # The cache lock is free while the new version builds
+    figures = stoki_prewarm.get_view_figures('Market Overview', old, old_version)
+    assert figures == {'view': 'Market Overview', 'rows': len(old['results'])}
+    assert stoki_prewarm._cache_version == old_version
+
+    gated_builds.set()
+    deadline = time.monotonic() + 10
+    while stoki_prewarm._cache_version != new_version and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stoki_prewarm._cache_version == new_version
+    assert set(stoki_prewarm._figure_cache) == {(view, new_version) for view in VIEW_FIGURES}
+    assert not stoki_prewarm._warming
+
+
+def test_refresh_is_kept_when_a_rerun_asks_for_the_cached_version(empty_cache, gated_builds):
+    old = demo_data()
+    new = dict(old, results=old['results'].iloc[:2])
+    old_version = stoki_prewarm.prewarm(old, workers=0)
+
+    gated_builds.clear()
+    new_version = stoki_prewarm.prewarm(new, workers=0)
+    # A session still on the old data reruns before the refresh finishes
+    assert stoki_prewarm.prewarm(old, workers=0) == old_version
+    gated_builds.set()
+
+    deadline = time.monotonic() + 10
+    while stoki_prewarm._warming and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stoki_prewarm._cache_version == new_version
+
+    # Switching back starts a fresh build, which is cached in turn
+    stoki_prewarm.prewarm(old, workers=0)
+    deadline = time.monotonic() + 10
+    while stoki_prewarm._warming and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stoki_prewarm._cache_version == old_version
+
+
+def test_cold_prewarm_waits_for_the_build_in_flight(empty_cache, gated_builds):
+    data = demo_data()
+    gated_builds.clear()
+    builder = threading.Thread(target=stoki_prewarm.prewarm, args=(data,), kwargs={'workers': 0})
+    builder.start()
+    while not stoki_prewarm._warming:
+        time.sleep(0.01)
+
+    waiter = threading.Thread(target=stoki_prewarm.prewarm, args=(data,), kwargs={'workers': 0})
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()
+
+    gated_builds.set()
+    builder.join(10)
+    waiter.join(10)
+    assert stoki_prewarm._cache_version == stoki_prewarm.data_version(data)